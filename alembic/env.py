@@ -13,6 +13,10 @@ load_dotenv()
 # access to the values within the .ini file in use.
 config = context.config
 
+# Use the same database as the CLI when DATABASE_URL is set
+if os.getenv("DATABASE_URL"):
+    config.set_main_option("sqlalchemy.url", os.environ["DATABASE_URL"].replace("%", "%%"))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
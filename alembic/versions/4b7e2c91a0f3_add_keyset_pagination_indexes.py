@@ -0,0 +1,33 @@
+"""Add keyset pagination indexes
+
+Revision ID: 4b7e2c91a0f3
+Revises: d15f877f8239
+Create Date: 2026-10-18 10:03:17.582046
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4b7e2c91a0f3'
+down_revision: Union[str, Sequence[str], None] = 'd15f877f8239'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Listings page on (created_at, id); include id so the keyset condition is an index range
+    op.create_index('ix_tasks_project_id_created_at_id', 'tasks', ['project_id', 'created_at', 'id'])
+    op.drop_index('ix_tasks_project_id_created_at', table_name='tasks')
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
+    op.create_index('ix_tasks_project_id_created_at', 'tasks', ['project_id', 'created_at'])
+    op.drop_index('ix_tasks_project_id_created_at_id', table_name='tasks')
@@ -0,0 +1,64 @@
+"""Add change notify triggers
+
+Revision ID: 5d9b3e7a1c06
+Revises: e2a4f6c83b91
+Create Date: 2026-10-18 15:48:12.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d9b3e7a1c06'
+down_revision: Union[str, Sequence[str], None] = 'e2a4f6c83b91'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets `task watch` poll one project's recent changes where LISTEN is unavailable
+    op.create_index('ix_tasks_project_id_updated_at', 'tasks', ['project_id', 'updated_at'])
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # Publish every row change on a per-project channel; only ids are sent,
+    # watchers read the rows they need, which keeps payloads far below the 8000 byte limit
+    op.execute("""
+        CREATE FUNCTION notify_todo_change() RETURNS trigger AS $$
+        DECLARE
+            changed RECORD;
+            channel TEXT;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := OLD;
+            ELSE
+                changed := NEW;
+            END IF;
+            IF TG_TABLE_NAME = 'tasks' THEN
+                channel := 'project_' || changed.project_id;
+            ELSE
+                channel := 'project_' || changed.id;
+            END IF;
+            PERFORM pg_notify(channel, json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'id', changed.id)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table_name in ('tasks', 'projects'):
+        op.execute(f"""
+            CREATE TRIGGER {table_name}_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+            FOR EACH ROW EXECUTE FUNCTION notify_todo_change()
+        """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'postgresql':
+        for table_name in ('tasks', 'projects'):
+            op.execute(f"DROP TRIGGER {table_name}_notify_change ON {table_name}")
+        op.execute("DROP FUNCTION notify_todo_change()")
+    op.drop_index('ix_tasks_project_id_updated_at', table_name='tasks')
@@ -0,0 +1,29 @@
+"""Add task updated_at index
+
+Revision ID: 7f1d04b8c3e2
+Revises: a3c9e5d21f64
+Create Date: 2026-10-18 13:20:06.114873
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f1d04b8c3e2'
+down_revision: Union[str, Sequence[str], None] = 'a3c9e5d21f64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lets the reminder worker find tasks changed since its last tick
+    op.create_index('ix_tasks_updated_at', 'tasks', ['updated_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_updated_at', table_name='tasks')
@@ -0,0 +1,50 @@
+"""Add tasks archive
+
+Revision ID: 9a6c2d4e8f17
+Revises: 5d9b3e7a1c06
+Create Date: 2026-10-18 16:31:09.266481
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a6c2d4e8f17'
+down_revision: Union[str, Sequence[str], None] = '5d9b3e7a1c06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Done tasks closed long ago move here so listings only read the active set
+    op.create_table('tasks_archive',
+        sa.Column('id', sa.String(36), nullable=False),
+        sa.Column('title', sa.String(30), nullable=False),
+        sa.Column('description', sa.String(150), nullable=False),
+        sa.Column('status', sa.String(10), nullable=False),
+        sa.Column('deadline', sa.Date(), nullable=True),
+        sa.Column('closed_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('project_id', sa.String(36), nullable=False),
+        sa.Column('archived_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    # Serves `task list --include-archived`, which pages both tables on (created_at, id)
+    op.create_index('ix_tasks_archive_project_id_created_at_id', 'tasks_archive', ['project_id', 'created_at', 'id'])
+    # Finds archive candidates: done tasks ordered by when they were closed
+    op.create_index('ix_tasks_status_closed_at', 'tasks', ['status', 'closed_at'])
+    # Tasks marked done before closed_at was maintained count as closed at their last update
+    op.execute("UPDATE tasks SET closed_at = updated_at WHERE status = 'done' AND closed_at IS NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_status_closed_at', table_name='tasks')
+    op.drop_index('ix_tasks_archive_project_id_created_at_id', table_name='tasks_archive')
+    op.drop_table('tasks_archive')
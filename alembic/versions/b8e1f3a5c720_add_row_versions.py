@@ -0,0 +1,32 @@
+"""Add row versions
+
+Revision ID: b8e1f3a5c720
+Revises: 9a6c2d4e8f17
+Create Date: 2026-10-18 17:12:44.081552
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e1f3a5c720'
+down_revision: Union[str, Sequence[str], None] = '9a6c2d4e8f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Bumped by every write so edits can check that the row they read is unchanged;
+    # the archive keeps the version a task had when it was moved
+    for table_name in ('projects', 'tasks', 'tasks_archive'):
+        op.add_column(table_name, sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table_name in ('tasks_archive', 'tasks', 'projects'):
+        op.drop_column(table_name, 'version')
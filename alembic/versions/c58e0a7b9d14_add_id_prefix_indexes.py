@@ -0,0 +1,36 @@
+"""Add id prefix indexes
+
+Revision ID: c58e0a7b9d14
+Revises: 7f1d04b8c3e2
+Create Date: 2026-10-18 14:05:31.402186
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c58e0a7b9d14'
+down_revision: Union[str, Sequence[str], None] = '7f1d04b8c3e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The primary keys use the database collation, which PostgreSQL cannot use
+    # for LIKE 'prefix%'; pattern ops compare bytewise so prefixes become range scans
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.create_index('ix_projects_id_pattern', 'projects', ['id'], postgresql_ops={'id': 'varchar_pattern_ops'})
+    op.create_index('ix_tasks_id_pattern', 'tasks', ['id'], postgresql_ops={'id': 'varchar_pattern_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_tasks_id_pattern', table_name='tasks')
+    op.drop_index('ix_projects_id_pattern', table_name='projects')
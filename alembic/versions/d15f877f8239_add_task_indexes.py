@@ -0,0 +1,35 @@
+"""Add task indexes
+
+Revision ID: d15f877f8239
+Revises: 62037a3fdae8
+Create Date: 2026-10-18 09:12:41.205318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd15f877f8239'
+down_revision: Union[str, Sequence[str], None] = '62037a3fdae8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Task listings filter on project and order by creation time
+    op.create_index('ix_tasks_project_id_created_at', 'tasks', ['project_id', 'created_at'])
+    # Status filtering within a project
+    op.create_index('ix_tasks_project_id_status', 'tasks', ['project_id', 'status'])
+    # Deadline range scans (due soon / overdue)
+    op.create_index('ix_tasks_deadline_status', 'tasks', ['deadline', 'status'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_deadline_status', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_status', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_created_at', table_name='tasks')
@@ -0,0 +1,48 @@
+"""Cascade task project foreign key
+
+Revision ID: e2a4f6c83b91
+Revises: c58e0a7b9d14
+Create Date: 2026-10-18 15:02:47.905318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a4f6c83b91'
+down_revision: Union[str, Sequence[str], None] = 'c58e0a7b9d14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite cannot alter constraints in place and does not enforce foreign
+    # keys by default, so the CLI keeps deleting tasks explicitly there
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # The cascade looks tasks up through ix_tasks_project_id_status and
+    # ix_tasks_project_id_created_at_id, which both lead with project_id.
+    # NOT VALID skips the full-table check while the ACCESS EXCLUSIVE lock is
+    # held. The migrations share one transaction, so VALIDATE runs in an
+    # autocommit block: that commits the swap and releases its lock first,
+    # and the scan then only takes SHARE UPDATE EXCLUSIVE, which lets writes
+    # through.
+    op.drop_constraint('tasks_project_id_fkey', 'tasks', type_='foreignkey')
+    op.execute("""
+        ALTER TABLE tasks ADD CONSTRAINT tasks_project_id_fkey
+        FOREIGN KEY (project_id) REFERENCES projects (id) ON DELETE CASCADE NOT VALID
+    """)
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE tasks VALIDATE CONSTRAINT tasks_project_id_fkey")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_constraint('tasks_project_id_fkey', 'tasks', type_='foreignkey')
+    op.create_foreign_key('tasks_project_id_fkey', 'tasks', 'projects', ['project_id'], ['id'])
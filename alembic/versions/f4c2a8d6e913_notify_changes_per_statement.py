@@ -0,0 +1,103 @@
+"""Notify changes per statement
+
+Revision ID: f4c2a8d6e913
+Revises: b8e1f3a5c720
+Create Date: 2026-10-18 18:05:31.642907
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c2a8d6e913'
+down_revision: Union[str, Sequence[str], None] = 'b8e1f3a5c720'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Above this many rows per project a notification carries only the count,
+# which keeps payloads far below the 8000 byte limit
+NOTIFY_MAX_IDS = 100
+
+TRIGGERS = (('insert', 'INSERT', 'NEW TABLE AS new_rows'),
+            ('update', 'UPDATE', 'NEW TABLE AS new_rows'),
+            ('delete', 'DELETE', 'OLD TABLE AS old_rows'))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    # The row-level triggers ran plpgsql and pg_notify once per row, which
+    # `task import --copy`, `archive run` and chunked deletes paid for every
+    # row they wrote. Statement-level triggers read the rows a statement
+    # touched from its transition table and notify once per project.
+    for table_name in ('tasks', 'projects'):
+        op.execute(f"DROP TRIGGER {table_name}_notify_change ON {table_name}")
+    op.execute("DROP FUNCTION notify_todo_change()")
+    op.execute(f"""
+        CREATE FUNCTION notify_todo_changes() RETURNS trigger AS $$
+        DECLARE
+            changed RECORD;
+        BEGIN
+            FOR changed IN EXECUTE format(
+                'SELECT %I AS project_id, count(*) AS n,'
+                ' CASE WHEN count(*) <= {NOTIFY_MAX_IDS} THEN array_agg(id) END AS ids'
+                ' FROM %I GROUP BY 1',
+                CASE WHEN TG_TABLE_NAME = 'tasks' THEN 'project_id' ELSE 'id' END,
+                CASE WHEN TG_OP = 'DELETE' THEN 'old_rows' ELSE 'new_rows' END
+            ) LOOP
+                PERFORM pg_notify('project_' || changed.project_id, json_build_object(
+                    'table', TG_TABLE_NAME, 'op', TG_OP, 'ids', changed.ids, 'count', changed.n
+                )::text);
+            END LOOP;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table_name in ('tasks', 'projects'):
+        for name, event, transition in TRIGGERS:
+            op.execute(f"""
+                CREATE TRIGGER {table_name}_notify_{name}
+                AFTER {event} ON {table_name} REFERENCING {transition}
+                FOR EACH STATEMENT EXECUTE FUNCTION notify_todo_changes()
+            """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table_name in ('tasks', 'projects'):
+        for name, _, _ in TRIGGERS:
+            op.execute(f"DROP TRIGGER {table_name}_notify_{name} ON {table_name}")
+    op.execute("DROP FUNCTION notify_todo_changes()")
+    op.execute("""
+        CREATE FUNCTION notify_todo_change() RETURNS trigger AS $$
+        DECLARE
+            changed RECORD;
+            channel TEXT;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                changed := OLD;
+            ELSE
+                changed := NEW;
+            END IF;
+            IF TG_TABLE_NAME = 'tasks' THEN
+                channel := 'project_' || changed.project_id;
+            ELSE
+                channel := 'project_' || changed.id;
+            END IF;
+            PERFORM pg_notify(channel, json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'id', changed.id)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table_name in ('tasks', 'projects'):
+        op.execute(f"""
+            CREATE TRIGGER {table_name}_notify_change
+            AFTER INSERT OR UPDATE OR DELETE ON {table_name}
+            FOR EACH ROW EXECUTE FUNCTION notify_todo_change()
+        """)
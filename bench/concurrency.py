@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Concurrent-writer stress check for version-checked edits.
+
+Several writer threads each increment a counter kept in one task's title,
+reading the row, pausing as a user at the prompts would, then writing it
+back with `task edit ... --if-version`. A conflicting write is rejected and
+retried from a fresh read, so the final counter must equal writers x
+increments. --unversioned drops the check to show the lost updates it
+prevents. Runs against a throwaway SQLite file by default, or against an
+empty database given with --url. Exits non-zero if a versioned run loses
+updates.
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from run import ROOT, migrate
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Stress version-checked task edits with concurrent writers")
+    parser.add_argument("--url", help="database URL of an empty database (default: a temporary SQLite file)")
+    parser.add_argument("--writers", type=int, default=8, help="concurrent writer threads (default: 8)")
+    parser.add_argument("--increments", type=int, default=25, help="successful edits per writer (default: 25)")
+    parser.add_argument("--think-ms", type=float, default=2.0, help="pause between read and write (default: 2)")
+    parser.add_argument("--unversioned", action="store_true", help="write without --if-version to show lost updates")
+    return parser.parse_args(argv)
+
+
+def setup(cli):
+    """Create one project holding one task whose title is the counter."""
+    project_id, task_id, now = str(uuid.uuid4()), str(uuid.uuid4()), datetime.utcnow()
+    with cli.engine.begin() as conn:
+        conn.execute(cli.text("""
+            INSERT INTO projects (id, name, description, created_at, updated_at)
+            VALUES (:id, :name, '', :now, :now)
+        """), {"id": project_id, "name": f"stress-{task_id[:8]}", "now": now})
+        conn.execute(cli.text("""
+            INSERT INTO tasks (id, title, description, status, project_id, created_at, updated_at)
+            VALUES (:id, '0', '', 'todo', :pid, :now, :now)
+        """), {"id": task_id, "pid": project_id, "now": now})
+    return project_id, task_id
+
+
+def writer(cli, project_id, task_id, increments, think, versioned):
+    """Apply ``increments`` read-modify-write edits and return how many attempts were rejected."""
+    runner = cli.CLI(interactive=False, out=io.StringIO())
+    done = rejected = 0
+    while done < increments:
+        with cli.engine.connect() as conn:
+            title, version = conn.execute(
+                cli.text("SELECT title, version FROM tasks WHERE id = :id"), {"id": task_id}
+            ).one()
+        time.sleep(think)
+        cmd = f"task edit {project_id} {task_id} --title {int(title) + 1}"
+        if versioned:
+            cmd += f" --if-version {version}"
+        if runner.run_command(cmd):
+            done += 1
+        else:
+            rejected += 1
+    return rejected
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='todo-bench-'), 'bench.db')}"
+    os.environ["DATABASE_URL"] = url
+    sys.path.insert(0, ROOT)
+    migrate(url)
+    import cli
+
+    project_id, task_id = setup(cli)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.writers) as pool:
+        futures = [
+            pool.submit(writer, cli, project_id, task_id, args.increments, args.think_ms / 1000, not args.unversioned)
+            for _ in range(args.writers)
+        ]
+        rejected = sum(f.result() for f in futures)
+    elapsed = time.perf_counter() - started
+
+    with cli.engine.connect() as conn:
+        final = int(conn.execute(cli.text("SELECT title FROM tasks WHERE id = :id"), {"id": task_id}).scalar())
+    expected = args.writers * args.increments
+    print(f"{'unversioned' if args.unversioned else 'versioned'}: {args.writers} writers x {args.increments} edits "
+          f"in {elapsed:.2f}s ({expected / elapsed:.0f} edits/s)")
+    print(f"counter {final}/{expected}, lost updates {expected - final}, rejected attempts {rejected}")
+    return 1 if final != expected and not args.unversioned else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the ToDoList CLI commands.
+
+Seeds a database with N projects x M tasks, then times every CLI subcommand
+and writes latency percentiles, queries per command and RSS growth as JSON.
+Runs offline against a throwaway SQLite file by default, or against an empty
+database given with --url (e.g. a local PostgreSQL container).
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEED_BATCH_SIZE = 10000
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ToDoList CLI commands")
+    parser.add_argument("--url", help="database URL of an empty database (default: a temporary SQLite file)")
+    parser.add_argument("--projects", type=int, default=10, help="projects to seed (default: 10)")
+    parser.add_argument("--tasks", type=int, default=1000, help="tasks per seeded project (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=50, help="timed runs per command (default: 50)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument("--output", default="bench-results.json", help="where to write the JSON results")
+    parser.add_argument("--compare", metavar="FILE", help="earlier results to print deltas against")
+    return parser.parse_args(argv)
+
+
+def migrate(url):
+    from alembic import command
+    from alembic.config import Config
+
+    cfg = Config(os.path.join(ROOT, "alembic.ini"))
+    cfg.set_main_option("script_location", os.path.join(ROOT, "alembic"))
+    cfg.set_main_option("sqlalchemy.url", url.replace("%", "%%"))
+    # alembic/env.py takes DATABASE_URL over the configured URL, so point it at ours for the upgrade
+    previous = os.environ.get("DATABASE_URL")
+    os.environ["DATABASE_URL"] = url
+    try:
+        command.upgrade(cfg, "head")
+    finally:
+        if previous is None:
+            del os.environ["DATABASE_URL"]
+        else:
+            os.environ["DATABASE_URL"] = previous
+
+
+def seed(cli, projects, tasks_per_project):
+    """Insert the fixture rows in batches and return the seeded project ids."""
+    from sqlalchemy import column, insert, table
+
+    projects_table = table("projects", column("id"), column("name"), column("description"),
+                           column("created_at"), column("updated_at"))
+    now = datetime.utcnow()
+    project_ids = [str(uuid.uuid4()) for _ in range(projects)]
+    with cli.engine.begin() as conn:
+        conn.execute(insert(projects_table), [
+            {"id": pid, "name": f"seed-{i}", "description": "", "created_at": now, "updated_at": now}
+            for i, pid in enumerate(project_ids)
+        ])
+
+    statuses = cli.STATUS_VALUES
+    today = date.today()
+    batch = []
+    for pid in project_ids:
+        for i in range(tasks_per_project):
+            batch.append({
+                "id": str(uuid.uuid4()),
+                "title": f"task-{i}",
+                "description": "",
+                "status": statuses[i % len(statuses)],
+                "deadline": today + timedelta(days=i % 60 - 30) if i % 2 else None,
+                "closed_at": now if statuses[i % len(statuses)] == "done" else None,
+                "project_id": pid,
+                "created_at": now + timedelta(microseconds=i),
+                "updated_at": now,
+            })
+            if len(batch) >= SEED_BATCH_SIZE:
+                with cli.engine.begin() as conn:
+                    conn.execute(insert(cli.tasks_table), batch)
+                batch = []
+    if batch:
+        with cli.engine.begin() as conn:
+            conn.execute(insert(cli.tasks_table), batch)
+    return project_ids
+
+
+def rss_kb():
+    """Current resident set size; falls back to the lifetime peak where /proc is missing."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+        return usage // 1024 if sys.platform == "darwin" else usage
+
+
+def percentile(samples, pct):
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+
+def time_command(cli, runner, commands):
+    """Run each command once and return ``(latencies_ms, queries_per_command, db_ms_per_command)``."""
+    stats = cli.QueryStats().attach(cli.engine)
+    latencies = []
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            for cmd in commands:
+                started = time.perf_counter()
+                runner.handle(cmd)
+                latencies.append((time.perf_counter() - started) * 1000)
+    finally:
+        stats.detach()
+    return latencies, stats.queries / len(commands), stats.db_time * 1000 / len(commands)
+
+
+def command_plan(cli, rng, project_ids, repeat):
+    """Yield ``(name, commands)`` in an order where each step has the rows it needs."""
+    from sqlalchemy import text
+
+    with cli.engine.connect() as conn:
+        sample = conn.execute(
+            text("SELECT id, project_id FROM tasks ORDER BY id LIMIT :n"), {"n": repeat}
+        ).fetchall()
+    targets = ([(t[1], t[0]) for t in sample] or [(project_ids[0], "missing")]) * repeat
+    targets = targets[:repeat]
+    pick = lambda: rng.choice(project_ids)
+    run_id = uuid.uuid4().hex[:6]
+
+    yield "project create", [f"project create --name bench-{run_id}-{i} --description bench" for i in range(repeat)]
+    yield "project list", ["project list"] * repeat
+    yield "project stats", ["project stats"] * repeat
+    yield "project show", [f"project show {pick()}" for _ in range(repeat)]
+    yield "project edit", [f"project edit {pick()} --description edited-{i}" for i in range(repeat)]
+    yield "task add", [f"task add {pick()} --title bench-{i} --deadline 2030-01-01" for i in range(repeat)]
+    yield "task list", [f"task list {pick()}" for _ in range(repeat)]
+    yield "task list all", [f"task list {pick()} --include-archived --limit 50" for _ in range(repeat)]
+    yield "task search", [f"task search task-{i}" for i in range(repeat)]
+    yield "export", [f"export --project {pick()} --output {os.devnull}" for _ in range(repeat)]
+    yield "task edit", [f"task edit {pid} {tid} --title edited-{i}" for i, (pid, tid) in enumerate(targets)]
+    yield "task status", [f"task status {pid} {tid} done" for pid, tid in targets]
+
+    yield "archive run", ["archive run --older-than 0 --batch-size 100"] * repeat
+
+    with cli.engine.connect() as conn:
+        added = conn.execute(text("SELECT project_id, id FROM tasks WHERE title LIKE 'bench-%'")).fetchall()
+        created = conn.execute(text("SELECT id FROM projects WHERE name LIKE :p"), {"p": f"bench-{run_id}-%"}).fetchall()
+    yield "task delete", [f"task delete {pid} {tid} --yes" for pid, tid in added[:repeat]]
+    yield "project delete", [f"project delete {p[0]} --yes" for p in created[:repeat]]
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)["commands"]
+    print(f"\n{'command':<16}{'p50 ms':>18}{'p95 ms':>18}{'queries':>14}")
+    for name, row in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        cells = []
+        for key in ("p50_ms", "p95_ms"):
+            delta = (row[key] - old[key]) / old[key] * 100 if old[key] else 0
+            cells.append(f"{row[key]:8.2f} ({delta:+5.1f}%)")
+        print(f"{name:<16}{cells[0]:>18}{cells[1]:>18}{old['queries_per_command']:>6.1f} -> {row['queries_per_command']:<4.1f}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='todo-bench-'), 'bench.db')}"
+    # cli reads DATABASE_URL at import time and builds its engine from it on first use
+    os.environ["DATABASE_URL"] = url
+    sys.path.insert(0, ROOT)
+    migrate(url)
+    import cli
+    from sqlalchemy.engine import make_url
+
+    rng = random.Random(args.seed)
+    rss_before_seed = rss_kb()
+    started = time.perf_counter()
+    project_ids = seed(cli, args.projects, args.tasks)
+    seed_seconds = time.perf_counter() - started
+    seed_rss_kb = rss_kb() - rss_before_seed
+    print(f"Seeded {args.projects} projects x {args.tasks} tasks in {seed_seconds:.1f}s")
+
+    runner = cli.CLI(interactive=False)
+    results = {}
+    for name, commands in command_plan(cli, rng, project_ids, args.repeat):
+        if not commands:
+            continue
+        rss_before = rss_kb()
+        latencies, queries, db_ms = time_command(cli, runner, commands)
+        # Growth over the command's runs, so seeding and earlier commands don't show up here
+        rss_growth = rss_kb() - rss_before
+        results[name] = {
+            "runs": len(latencies),
+            "mean_ms": round(statistics.fmean(latencies), 3),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "db_ms": round(db_ms, 3),
+            "queries_per_command": round(queries, 2),
+            "rss_growth_kb": rss_growth,
+        }
+        r = results[name]
+        print(f"{name:<16} p50 {r['p50_ms']:8.2f} ms  p95 {r['p95_ms']:8.2f} ms  p99 {r['p99_ms']:8.2f} ms  "
+              f"{r['queries_per_command']:4.1f} queries  {r['rss_growth_kb']:+} KB")
+
+    report = {
+        "meta": {
+            "url": make_url(url).render_as_string(hide_password=True),
+            "projects": args.projects,
+            "tasks_per_project": args.tasks,
+            "repeat": args.repeat,
+            "seed_seconds": round(seed_seconds, 3),
+            "seed_rss_kb": seed_rss_kb,
+            "python": platform.python_version(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        },
+        "commands": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the ToDoList CLI.
+
+Times fresh interpreter runs, which is what a scripted one-off invocation
+pays: importing cli, running `help` (which should never touch the database)
+and running a first real command against a migrated database. Results are
+written as JSON in the same shape as run.py so they can be compared between
+releases.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from run import ROOT, migrate, percentile
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ToDoList CLI startup")
+    parser.add_argument("--url", help="database URL of an empty database (default: a temporary SQLite file)")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case (default: 20)")
+    parser.add_argument("--output", default="bench-startup.json", help="where to write the JSON results")
+    parser.add_argument("--compare", metavar="FILE", help="earlier results to print deltas against")
+    return parser.parse_args(argv)
+
+
+def cases():
+    cli_path = os.path.join(ROOT, "cli.py")
+    yield "interpreter", [sys.executable, "-c", "pass"]
+    yield "import cli", [sys.executable, "-c", "import cli"]
+    yield "help", [sys.executable, cli_path, "-c", "help"]
+    yield "first command", [sys.executable, cli_path, "-c", "project list --limit 1"]
+
+
+def time_case(argv, env, repeat):
+    latencies = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run(argv, cwd=ROOT, env=env, check=True, stdout=subprocess.DEVNULL)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return latencies
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = json.load(f)["commands"]
+    print(f"\n{'case':<16}{'p50 ms':>20}{'p95 ms':>20}")
+    for name, row in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        cells = []
+        for key in ("p50_ms", "p95_ms"):
+            delta = (row[key] - old[key]) / old[key] * 100 if old[key] else 0
+            cells.append(f"{row[key]:9.2f} ({delta:+5.1f}%)")
+        print(f"{name:<16}{cells[0]:>20}{cells[1]:>20}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='todo-bench-'), 'bench.db')}"
+    migrate(url)
+    env = dict(os.environ, DATABASE_URL=url)
+
+    results = {}
+    for name, argv_ in cases():
+        latencies = time_case(argv_, env, args.repeat)
+        results[name] = {
+            "runs": len(latencies),
+            "mean_ms": round(statistics.fmean(latencies), 3),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+        }
+        r = results[name]
+        print(f"{name:<16} p50 {r['p50_ms']:8.2f} ms  p95 {r['p95_ms']:8.2f} ms")
+
+    report = {
+        "meta": {
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "timestamp": datetime.utcnow().isoformat(timespec="seconds"),
+        },
+        "commands": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {args.output}")
+    if args.compare:
+        compare(results, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
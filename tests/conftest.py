@@ -0,0 +1,45 @@
+import io
+import os
+import sys
+import uuid
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cli as cli_module
+from bench.run import migrate
+
+
+@pytest.fixture(scope="session")
+def cli(tmp_path_factory):
+    """The cli module bound to a freshly migrated SQLite database."""
+    url = f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}"
+    migrate(url)
+    cli_module.DATABASE_URL = url
+    cli_module.get_engine.cache_clear()
+    cli_module.get_sessionmaker.cache_clear()
+    cli_module.project_cache.clear()
+    yield cli_module
+    cli_module.get_engine().dispose()
+
+
+@pytest.fixture
+def runner(cli):
+    return cli.CLI(interactive=False, out=io.StringIO())
+
+
+@pytest.fixture
+def project_id(cli, runner):
+    name = f"project-{uuid.uuid4()}"
+    assert runner.run_command(f"project create --name {name}")
+    with cli.session_scope() as db:
+        return db.execute(cli.text("SELECT id FROM projects WHERE name = :name"), {"name": name}).scalar()
+
+
+@pytest.fixture
+def task_id(cli, runner, project_id):
+    assert runner.run_command(f"task add {project_id} --title first")
+    with cli.session_scope() as db:
+        return db.execute(cli.text("SELECT id FROM tasks WHERE project_id = :pid"), {"pid": project_id}).scalar()
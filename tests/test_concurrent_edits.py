@@ -0,0 +1,83 @@
+"""Interactive edits settle version conflicts by retry, merge or abort."""
+import builtins
+import io
+
+import pytest
+
+
+@pytest.fixture
+def interactive(cli):
+    return cli.CLI(interactive=True, out=io.StringIO())
+
+
+def read_task(cli, task_id):
+    with cli.session_scope() as db:
+        row = db.execute(
+            cli.text("SELECT title, description, version FROM tasks WHERE id = :id"), {"id": task_id}
+        ).fetchone()
+    return tuple(row)
+
+
+def answer_with(monkeypatch, interactive, answers, concurrent=None, at="New title"):
+    """Answer the edit prompts from ``answers``, keyed by the start of the prompt.
+
+    ``concurrent`` runs the first time the ``at`` prompt is shown, standing
+    in for another user who writes while this one is typing.
+    """
+    asked = []
+
+    def fake_input(prompt):
+        # The read that fed the prompt must not keep a transaction open
+        assert not interactive.db.in_transaction()
+        asked.append(prompt)
+        if concurrent and prompt.startswith(at) and sum(p.startswith(at) for p in asked) == 1:
+            concurrent()
+        for start, values in answers.items():
+            if prompt.startswith(start):
+                return values.pop(0) if isinstance(values, list) else values
+        return ""
+
+    monkeypatch.setattr(builtins, "input", fake_input)
+    return asked
+
+
+def test_merge_keeps_both_changes(cli, runner, interactive, monkeypatch, project_id, task_id):
+    concurrent = lambda: runner.run_command(f"task edit {project_id} {task_id} --description theirs")
+    answer_with(monkeypatch, interactive, {"New title": "mine", "[r]etry": "m"}, concurrent)
+
+    assert interactive.run_command(f"task edit {project_id} {task_id}")
+    assert read_task(cli, task_id) == ("mine", "theirs", 3)
+    assert "description:  -> theirs" in interactive.out.getvalue()
+
+
+def test_retry_starts_from_new_values(cli, runner, interactive, monkeypatch, project_id, task_id):
+    concurrent = lambda: runner.run_command(f"task edit {project_id} {task_id} --title theirs")
+    asked = answer_with(monkeypatch, interactive, {"New title": ["mine", "mine again"], "[r]etry": "r"}, concurrent)
+
+    assert interactive.run_command(f"task edit {project_id} {task_id}")
+    assert read_task(cli, task_id) == ("mine again", "", 3)
+    assert [p for p in asked if p.startswith("New title")][1].startswith("New title (current: theirs")
+
+
+def test_abort_leaves_the_other_change(cli, runner, interactive, monkeypatch, project_id, task_id):
+    concurrent = lambda: runner.run_command(f"task edit {project_id} {task_id} --title theirs")
+    answer_with(monkeypatch, interactive, {"New title": "mine", "[r]etry": "a"}, concurrent)
+
+    assert not interactive.run_command(f"task edit {project_id} {task_id}")
+    assert read_task(cli, task_id) == ("theirs", "", 2)
+
+
+def test_project_merge(cli, runner, interactive, monkeypatch, project_id):
+    concurrent = lambda: runner.run_command(f"project edit {project_id} --description theirs")
+    answer_with(monkeypatch, interactive, {"New description": "mine", "[r]etry": "m"}, concurrent, at="New name")
+
+    assert interactive.run_command(f"project edit {project_id}")
+    with cli.session_scope() as db:
+        assert db.execute(cli.text("SELECT description, version FROM projects WHERE id = :id"),
+                          {"id": project_id}).one() == ("mine", 3)
+
+
+def test_if_version_conflict_fails(cli, runner, project_id, task_id):
+    assert not runner.run_command(f"task edit {project_id} {task_id} --title late --if-version 7")
+    assert "Conflict" in runner.out.getvalue()
+    assert read_task(cli, task_id)[0] == "first"
@@ -0,0 +1,37 @@
+"""Create and update commands must stay single round trips."""
+import pytest
+
+
+def count_statements(cli, runner, cmd):
+    with cli.StatementRecorder(cli.get_engine()) as recorder:
+        ok = runner.run_command(cmd)
+    return ok, len(recorder.statements)
+
+
+def test_project_create(cli, runner):
+    assert count_statements(cli, runner, "project create --name round-trip") == (True, 1)
+
+
+def test_project_create_duplicate(cli, runner):
+    assert runner.run_command("project create --name duplicate")
+    assert count_statements(cli, runner, "project create --name duplicate") == (False, 1)
+    assert "already exists" in runner.out.getvalue()
+
+
+def test_task_add(cli, runner, project_id):
+    assert count_statements(cli, runner, f"task add {project_id} --title write --deadline 2030-01-01") == (True, 1)
+
+
+@pytest.mark.parametrize("options", ["--title renamed", "--status doing --deadline none", "--description text --if-version 1"])
+def test_task_edit(cli, runner, project_id, task_id, options):
+    assert count_statements(cli, runner, f"task edit {project_id} {task_id} {options}") == (True, 1)
+
+
+def test_task_status(cli, runner, project_id, task_id):
+    assert count_statements(cli, runner, f"task status {project_id} {task_id} done") == (True, 1)
+
+
+def test_task_status_missing(cli, runner, project_id):
+    ok, statements = count_statements(cli, runner, f"task status {project_id} {'0' * 36} done")
+    assert (ok, statements) == (False, 1)
+    assert "Task not found." in runner.out.getvalue()
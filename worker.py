@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+ToDoList deadline reminder worker
+"""
+import json
+import os
+import time
+import urllib.request
+from datetime import date, datetime, timedelta
+
+import click
+import schedule
+
+from cli import format_date, session_scope, text
+
+BATCH_SIZE = 500
+REMEMBER_DAYS = 30
+# How far before the previous tick to look for edits, to cover writes stamped before they commit
+OVERLAP_SECONDS = 300
+
+TASK_COLUMNS = "id, project_id, title, status, deadline, updated_at"
+
+
+def load_state(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_state(path, state):
+    # Write then rename so an interrupted save never leaves a truncated file
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp, path)
+
+
+def newly_due(db, horizon, mark):
+    """Yield open tasks due by ``horizon`` that sort after the ``(deadline, id)`` mark.
+
+    This is a range scan on the (deadline, status) index that resumes where
+    the previous tick stopped, read in batches.
+    """
+    while True:
+        params = {"horizon": horizon, "limit": BATCH_SIZE}
+        condition = "deadline IS NOT NULL"
+        if mark:
+            condition = "(deadline, id) > (:mark_deadline, :mark_id)"
+            params["mark_deadline"], params["mark_id"] = date.fromisoformat(mark[0]), mark[1]
+        rows = db.execute(text(f"""
+            SELECT {TASK_COLUMNS} FROM tasks
+            WHERE {condition} AND deadline <= :horizon AND status <> 'done'
+            ORDER BY deadline, id
+            LIMIT :limit
+        """), params).fetchall()
+        yield from rows
+        if len(rows) < BATCH_SIZE:
+            return
+        mark = (format_date(rows[-1][4]), rows[-1][0])
+
+
+def changed_behind_mark(db, mark, since):
+    """Return open tasks added or edited since the last tick whose deadline is already behind the mark.
+
+    Any write moves ``updated_at``, so this includes tasks that were already
+    reminded about; ``tick`` filters those out against the state file.
+    ``since`` should lie a little before the previous tick, because writers
+    stamp ``updated_at`` before they commit.
+    """
+    if not mark or not since:
+        return []
+    return db.execute(text(f"""
+        SELECT {TASK_COLUMNS} FROM tasks
+        WHERE updated_at >= :since AND deadline <= :mark_deadline AND status <> 'done'
+        ORDER BY deadline, id
+    """), {"since": since, "mark_deadline": date.fromisoformat(mark[0])}).fetchall()
+
+
+def notification(row, today):
+    deadline = format_date(row[4])
+    return {
+        "kind": "overdue" if deadline < today.isoformat() else "due",
+        "task_id": row[0],
+        "project_id": row[1],
+        "title": row[2],
+        "status": row[3],
+        "deadline": deadline,
+    }
+
+
+def make_sink(sink, path, url):
+    if sink == "stdout":
+        return lambda n: print(f"[{n['kind']}] {n['deadline']} {n['title']} (task {n['task_id'][:8]}, project {n['project_id'][:8]})", flush=True)
+    if sink == "file":
+        def write(n):
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(n) + "\n")
+        return write
+
+    def post(n):
+        request = urllib.request.Request(url, data=json.dumps(n).encode(), headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=10):
+            pass
+    return post
+
+
+def tick(state_path, window_days, emit, remember_days=REMEMBER_DAYS, overlap=OVERLAP_SECONDS):
+    """Emit reminders for tasks that became due since the last tick and advance the mark.
+
+    Edits are looked for from ``overlap`` seconds before the previous tick.
+    The state file maps each reminded task to the deadline it was reminded
+    about and when, so edits that leave the deadline alone (a new title, a
+    status change between open states) and the overlap itself do not send the
+    reminder again. Entries older than ``remember_days`` are dropped.
+    """
+    state = load_state(state_path)
+    mark = (state["deadline"], state["id"]) if state.get("deadline") else None
+    started = datetime.utcnow()
+    today = started.date()
+    horizon = today + timedelta(days=window_days)
+    # task id -> [deadline, reminded at]; older state files kept only the deadline
+    reminded = {task_id: entry if isinstance(entry, list) else [entry, started.isoformat()]
+                for task_id, entry in state.get("reminded", {}).items()}
+    since = datetime.fromisoformat(state["last_tick"]) - timedelta(seconds=overlap) if state.get("last_tick") else None
+    sent = 0
+
+    def remind(row):
+        nonlocal sent
+        deadline = format_date(row[4])
+        if reminded.get(row[0], [None])[0] != deadline:
+            emit(notification(row, today))
+            reminded[row[0]] = [deadline, started.isoformat()]
+            sent += 1
+        return deadline
+
+    with session_scope() as db:
+        for row in changed_behind_mark(db, mark, since):
+            remind(row)
+        for row in newly_due(db, horizon, mark):
+            mark = (remind(row), row[0])
+    forget_before = (started - timedelta(days=remember_days)).isoformat()
+    state.update(
+        last_tick=started.isoformat(),
+        reminded={task_id: entry for task_id, entry in reminded.items() if entry[1] >= forget_before},
+    )
+    if mark:
+        state.update(deadline=mark[0], id=mark[1])
+    save_state(state_path, state)
+    return sent
+
+
+@click.command()
+@click.option("--window-days", default=1, show_default=True, help="Remind about tasks due within this many days.")
+@click.option("--every", default=60, show_default=True, help="Seconds between ticks.")
+@click.option("--sink", type=click.Choice(["stdout", "file", "webhook"]), default="stdout", show_default=True)
+@click.option("--file", "file_path", default="reminders.jsonl", show_default=True, help="Output file for --sink file.")
+@click.option("--url", help="Endpoint for --sink webhook.")
+@click.option("--state", "state_path", default=".reminder-state.json", show_default=True,
+              help="Where the high-water mark is kept between ticks and restarts.")
+@click.option("--remember-days", default=REMEMBER_DAYS, show_default=True,
+              help="Remember reminders sent within this many days, so they are not repeated.")
+@click.option("--once", is_flag=True, help="Run a single tick and exit.")
+def main(window_days, every, sink, file_path, url, state_path, remember_days, once):
+    """Periodically emit reminders for tasks that are due soon or overdue."""
+    if sink == "webhook" and not url:
+        raise click.UsageError("--sink webhook needs --url.")
+    emit = make_sink(sink, file_path, url)
+
+    def run():
+        try:
+            sent = tick(state_path, window_days, emit, remember_days)
+            click.echo(f"{datetime.now():%Y-%m-%d %H:%M:%S} sent {sent} reminder(s)", err=True)
+        except Exception as e:
+            click.echo(f"Error: {e}", err=True)
+
+    run()
+    if once:
+        return
+    schedule.every(every).seconds.do(run)
+    try:
+        while True:
+            schedule.run_pending()
+            time.sleep(1)
+    except KeyboardInterrupt:
+        click.echo("Stopped.", err=True)
+
+
+if __name__ == "__main__":
+    main()